@@ -12,6 +12,7 @@ from PyQt6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMainWindow,
+    QProgressBar,
     QPushButton,
     QTextEdit,
     QVBoxLayout,
@@ -25,6 +26,19 @@ GITHUB_REPO_URL = "https://github.com/samzong/hf-model-downloader"
 AUTHOR_NAME = "samzong"
 AUTHOR_GITHUB_URL = "https://github.com/samzong"
 
+# The progress bar runs over a fixed scale, since byte counts overflow its int
+PROGRESS_SCALE = 1000
+
+
+def format_size(num_bytes):
+    """Human readable size, e.g. 1.5 GB"""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -229,6 +243,11 @@ class MainWindow(QMainWindow):
         button_layout.addWidget(self.stop_button)
         layout.addLayout(button_layout)
 
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, PROGRESS_SCALE)
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMinimumHeight(100)
@@ -276,6 +295,7 @@ class MainWindow(QMainWindow):
         help_section_height = 200
         form_fields_height = 200
         buttons_height = 40
+        progress_height = 30
         log_minimum_height = 100
         footer_height = 40
         margins_spacing = 40
@@ -285,6 +305,7 @@ class MainWindow(QMainWindow):
             + help_section_height
             + form_fields_height
             + buttons_height
+            + progress_height
             + log_minimum_height
             + footer_height
             + margins_spacing
@@ -298,6 +319,7 @@ class MainWindow(QMainWindow):
             self.download_worker.finished.disconnect()
             self.download_worker.error.disconnect()
             self.download_worker.status.disconnect()
+            self.download_worker.progress.disconnect()
             self.download_worker.log.disconnect()
 
             self.download_worker.cancel_download()
@@ -386,6 +408,7 @@ class MainWindow(QMainWindow):
         )
         self.update_status("Initializing download...")
         self.log_text.clear()
+        self._reset_progress()
 
         if platform == "ModelScope":
             self.download_worker = UnifiedDownloadWorker(
@@ -405,6 +428,9 @@ class MainWindow(QMainWindow):
         self.download_worker.status.connect(
             self.update_status, Qt.ConnectionType.QueuedConnection
         )
+        self.download_worker.progress.connect(
+            self.update_progress, Qt.ConnectionType.QueuedConnection
+        )
         self.download_worker.log.connect(
             self.update_log, Qt.ConnectionType.QueuedConnection
         )
@@ -421,6 +447,8 @@ class MainWindow(QMainWindow):
             self.update_status("Stopping download...")
             self.download_worker.cancel_download()
             self.download_button.setEnabled(True)
+            # A cancelled worker emits nothing more, download_error included
+            self._reset_progress()
 
     def update_status(self, message, error=False):
         if error:
@@ -431,6 +459,21 @@ class MainWindow(QMainWindow):
             self.log_text.verticalScrollBar().maximum()
         )
 
+    def update_progress(self, done, total):
+        """Show byte progress in the progress bar rather than the log"""
+        # Downloads that report no sizes keep the bar hidden
+        if not total:
+            return
+        self.progress_bar.setValue(min(PROGRESS_SCALE, done * PROGRESS_SCALE // total))
+        self.progress_bar.setFormat(f"{format_size(done)} / {format_size(total)}")
+        self.progress_bar.setVisible(True)
+
+    def _reset_progress(self):
+        """Empty and hide the progress bar until the next sized progress"""
+        self.progress_bar.setValue(0)
+        self.progress_bar.setFormat("")
+        self.progress_bar.setVisible(False)
+
     def update_log(self, message):
         self.log_text.append(message)
         self.log_text.verticalScrollBar().setValue(
@@ -441,6 +484,7 @@ class MainWindow(QMainWindow):
         self.download_button.setEnabled(True)
         self.stop_button.setEnabled(False)
         self.stop_button.setStyleSheet("")
+        self._reset_progress()
         self.update_status("✅ Download completed successfully!")
         self.log_text.append("✅ Download completed successfully!")
 
@@ -448,6 +492,7 @@ class MainWindow(QMainWindow):
         self.download_button.setEnabled(True)
         self.stop_button.setEnabled(False)
         self.stop_button.setStyleSheet("")
+        self._reset_progress()
         if "cancelled by user" in error_msg.lower():
             self.update_status("⏹️ Download stopped by user")
             self.log_text.append("⏹️ Download stopped by user")
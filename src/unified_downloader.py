@@ -3,6 +3,10 @@ Unified downloader for multiple model hub platforms
 Simple configuration-driven approach without over-engineering
 """
 
+import glob
+import hashlib
+import importlib
+import io
 import logging
 import multiprocessing
 import os
@@ -11,11 +15,19 @@ import sys
 import threading
 import time
 import weakref
-
-from PyQt6.QtCore import QMutex, QMutexLocker, QObject, QThread, QTimer, pyqtSignal
+from multiprocessing.connection import wait
+
+from PyQt6.QtCore import (
+    QMutex,
+    QMutexLocker,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+)
 from tqdm.auto import tqdm
 
-from .utils import cleanup_environment, cleanup_lock_files
+from .utils import cleanup_lock_files, env_override
 
 # Platform configurations - simple dictionary approach
 PLATFORM_CONFIGS = {
@@ -37,39 +49,92 @@ PLATFORM_CONFIGS = {
     },
 }
 
+# Every logger a worker's log handler can be attached to, resolved once
+_ALL_LOGGERS = [
+    logging.getLogger(logger_name)
+    for logger_name in sorted(
+        {config["logger_name"] for config in PLATFORM_CONFIGS.values()}
+        | {"UnifiedDownloadWorker", "PyQt6"}
+    )
+]
+
+# Download processes must not inherit PyQt state. Windows can only spawn; on
+# other platforms a forkserver imports the hub libraries once and forks each
+# download from there instead of starting a fresh interpreter per job.
+if sys.platform == "win32":
+    _mp_context = multiprocessing.get_context("spawn")
+else:
+    _mp_context = multiprocessing.get_context("forkserver")
+    _mp_context.set_forkserver_preload(
+        ["huggingface_hub", "modelscope", "tqdm", __name__]
+    )
 
-class LoggerManager:
-    """Unified logger handler management to prevent memory leaks"""
-
-    _instance = None
-    _handlers = {}
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
-    def get_handler(self, signal):
-        """Get or create log handler"""
-        handler_id = id(signal)
-        if handler_id not in self._handlers:
-            self._handlers[handler_id] = LogHandler(signal)
-        return self._handlers[handler_id]
-
-    def cleanup_handler(self, signal):
-        """Safely cleanup log handler"""
-        handler_id = id(signal)
-        if handler_id in self._handlers:
-            handler = self._handlers.pop(handler_id)
-            for config in PLATFORM_CONFIGS.values():
-                logger_name = config["logger_name"]
-                target_logger = logging.getLogger(logger_name)
-                if handler in target_logger.handlers:
-                    target_logger.removeHandler(handler)
-            for logger_name in ["UnifiedDownloadWorker", "PyQt6"]:
-                target_logger = logging.getLogger(logger_name)
-                if handler in target_logger.handlers:
-                    target_logger.removeHandler(handler)
+# Values that cannot change while the application runs, looked up once. The
+# affinity mask reflects container CPU limits that cpu_count() ignores.
+try:
+    _CPU_COUNT = len(os.sched_getaffinity(0)) or 4
+except AttributeError:
+    _CPU_COUNT = os.cpu_count() or 4
+DEBUG = bool(os.environ.get("HFDL_DEBUG"))
+
+# Files matching these patterns are never downloaded
+IGNORE_PATTERNS = ["*.h5", "*.ot", "*.msgpack", "*.bin", "*.pkl", "*.onnx", ".*"]
+
+# How often the worker thread publishes aggregate progress, in seconds
+PROGRESS_INTERVAL = 0.2
+
+# Pipe output is sent by the download process and forwarded to the GUI in
+# batches bounded by time and size
+LOG_FLUSH_INTERVAL = 0.05
+LOG_FLUSH_BYTES = 4096
+LOG_FLUSH_LINES = 16
+
+# Last line the download process sends; the NUL byte keeps it from ever
+# matching real log output
+COMPLETE_MARKER = "\x00COMPLETE"
+# Prefix of the line sent for each repo file once it is on disk
+FILE_MARKER = "\x00FILE "
+
+# Download concurrency is sized from the endpoint's round-trip time: enough
+# chunk-sized requests in flight to cover the bandwidth-delay product of an
+# assumed 1 Gbit/s link, clamped to a sane range
+PROBE_ATTEMPTS = 3
+PROBE_TIMEOUT = 2
+ASSUMED_BANDWIDTH = 125 * 1024 * 1024
+REQUEST_CHUNK_SIZE = 4 * 1024 * 1024
+MIN_WORKERS = 4
+MAX_WORKERS = 32
+MAX_RETRY_AFTER = 30
+
+# Large LFS files are fetched with parallel ranged requests written in place
+# into a preallocated file, then verified by re-reading them once
+LARGE_FILE_THRESHOLD = 128 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Worker floor for the latency-bound small-file pass and cap for the
+# bandwidth-bound pass over large files the ranged path could not fetch
+SMALL_FILE_WORKERS = 16
+LARGE_FILE_WORKERS = 4
+
+# Kernel buffer requested for the output pipe on Linux, so bursts of log
+# output do not block the download process
+PIPE_BUFFER_SIZE = 1024 * 1024
+
+# Downloads run on one shared thread pool created on first use, so the number
+# of concurrently active downloads is capped regardless of how many are queued
+_thread_pool = None
+
+# Shared byte counters installed in the download process, fed by the byte
+# progress bars; once the total is known from the repo listing the bars no
+# longer add their own sizes to it
+_progress_done = None
+_progress_total = None
+_progress_sized = False
+
+# Pipe the progress bars in the download process render to, and how many
+# refreshes a bar skips between sends
+_progress_pipe = None
+PROGRESS_DISPLAY_EVERY = 10
 
 
 class LogHandler(logging.Handler):
@@ -86,70 +151,547 @@ class LogHandler(logging.Handler):
             pass
 
 
+def _detach_handler(handler):
+    """Remove a worker's log handler from every logger it may be attached to"""
+    for target_logger in _ALL_LOGGERS:
+        target_logger.removeHandler(handler)
+
+
+class PipeLogHandler(logging.Handler):
+    """Forwards library log records from the download process to the pipe"""
+
+    def __init__(self, pipe):
+        super().__init__()
+        self.pipe = pipe
+
+    def emit(self, record):
+        try:
+            self.pipe.send(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+def _add_progress(counter, n):
+    """Add n to one of the shared progress counters, if installed"""
+    if counter is not None and n:
+        with counter.get_lock():
+            counter.value += int(n)
+
+
+def _set_progress(done=None, total=None):
+    """Overwrite the shared byte counters between download passes"""
+    global _progress_sized
+    if total is not None and _progress_total is not None:
+        _progress_total.value = total
+        _progress_sized = True
+    if done is not None and _progress_done is not None:
+        _progress_done.value = done
+
+
 class UnifiedProgressBar(tqdm):
+    """Progress bar that feeds shared counters instead of writing to the pipe
+
+    Only byte bars count towards the counters; bars over files or other
+    items just render their text.
+    """
+
     def __init__(self, *args, **kwargs):
+        kwargs.setdefault("file", io.StringIO())
+        # Refresh at most four times a second, skip the rate smoothing and
+        # never query the terminal size
+        kwargs.setdefault("mininterval", 0.25)
+        kwargs.setdefault("maxinterval", 2.0)
+        kwargs.setdefault("miniters", 0)
+        kwargs.setdefault("smoothing", 0)
+        kwargs.setdefault("dynamic_ncols", False)
+        # None tells tqdm to disable itself when not writing to a terminal,
+        # which the StringIO never is
+        if kwargs.get("disable", False) is None:
+            kwargs["disable"] = False
+        # tqdm already renders once from its constructor
+        self._displays = 0
+        # Read before tqdm runs: a disabled bar returns from its constructor
+        # without setting unit, yet its updates should still be counted
+        self._counts_bytes = kwargs.get("unit") == "B"
         super().__init__(*args, **kwargs)
-        self._current = self.n
+        if self._counts_bytes:
+            # A resumed file starts with its existing bytes already done
+            _add_progress(_progress_done, self.n)
+            if not _progress_sized:
+                _add_progress(_progress_total, self.total)
 
-    def update(self, n):
+    def update(self, n=1):
         super().update(n)
-        self._current += n
+        if self._counts_bytes:
+            _add_progress(_progress_done, n)
+
+    def display(self, msg=None, pos=None):
+        # The worker thread polls the shared counters, so the rendered bar is
+        # only forwarded to the log now and then
+        self._displays += 1
+        if _progress_pipe is not None and self._displays % PROGRESS_DISPLAY_EVERY == 1:
+            _progress_pipe.write("\r" + (msg or str(self)))
+        return True
 
 
 class SafePipeWriter:
-    """Process-safe pipe writer that doesn't hold PyQt references"""
+    """Process-safe pipe writer that doesn't hold PyQt references
+
+    Messages are buffered and sent as newline-joined byte frames, so the
+    reader splits each frame back into lines.
+    """
 
     def __init__(self, pipe):
-        if hasattr(pipe, "send"):
+        if hasattr(pipe, "send_bytes"):
             self.pipe = pipe
         else:
             # Create a simple wrapper for non-pipe objects
             self.pipe = None
-        self.buffer = ""
-        self.last_progress = ""
+        self.buffer = bytearray()
+        # Hash of the last progress line sent, used to drop repeated lines
+        self._last_hash = None
         self._closed = False
+        # Reentrant because the SIGTERM handler may send while a send is
+        # in progress on the same thread
+        self._lock = threading.RLock()
+        self._pending = []
+        self._pending_bytes = 0
+        self._flush_timer = None
 
     def send(self, message):
-        """Send message through pipe with error handling"""
+        """Queue a message for the pipe, sending the batch once it is due"""
         if self._closed or not self.pipe:
             return
+        data = str(message).encode("utf-8", "replace")
+        with self._lock:
+            self._pending.append(data)
+            self._pending_bytes += len(data)
+            if self._pending_bytes >= LOG_FLUSH_BYTES:
+                self._send_pending()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    LOG_FLUSH_INTERVAL, self._flush_pending
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush_pending(self):
+        with self._lock:
+            self._send_pending()
+
+    def _send_pending(self):
+        """Send queued messages as one frame, must hold the lock"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return
         try:
-            self.pipe.send(str(message))
+            if not self._closed and self.pipe:
+                self.pipe.send_bytes(b"\n".join(self._pending))
         except (BrokenPipeError, OSError, EOFError):
             self._closed = True
+        self._pending.clear()
+        self._pending_bytes = 0
 
     def write(self, text):
         if self._closed:
             return
 
-        if "\r" in text:
-            self.buffer = text.split("\r")[-1]
-            if self.buffer.strip() and self.buffer != self.last_progress:
-                self.send(self.buffer)
-                self.last_progress = self.buffer
-        elif "\n" in text:
-            self.buffer += text
-            lines = self.buffer.split("\n")
-            self.buffer = lines[-1]
-            for line in lines[:-1]:
-                if line.strip() and line != self.last_progress:
-                    self.send(line)
-        else:
-            self.buffer += text
+        data = text.encode("utf-8", "replace")
+        # Transfer threads write progress concurrently into one buffer
+        with self._lock:
+            buf = self.buffer
+            buf += data
+
+            cr = buf.rfind(b"\r")
+            if cr != -1:
+                # Only the text after the last carriage return is still on screen
+                del buf[: cr + 1]
+                if buf and not buf.isspace():
+                    self._send_line(buf.decode("utf-8", "replace"))
+                return
+
+            nl = buf.rfind(b"\n")
+            if nl == -1:
+                return
+            with memoryview(buf) as view:
+                start = 0
+                while start <= nl:
+                    end = buf.find(b"\n", start)
+                    line = str(view[start:end], "utf-8", "replace")
+                    if line.strip():
+                        self._send_line(line)
+                    start = end + 1
+            del buf[: nl + 1]
 
     def flush(self):
-        if (
-            not self._closed
-            and self.buffer.strip()
-            and self.buffer != self.last_progress
-        ):
-            self.send(self.buffer)
-            self.buffer = ""
+        with self._lock:
+            if not self._closed and self.buffer.strip():
+                self._send_line(self.buffer.decode("utf-8", "replace"))
+                self.buffer.clear()
+            self._send_pending()
+
+    def _send_line(self, line):
+        """Send a line unless it repeats the previous one"""
+        line_hash = hash(line)
+        if line_hash != self._last_hash:
+            self._last_hash = line_hash
+            self.send(line)
 
     def close(self):
-        """Close the pipe writer"""
-        self._closed = True
-        self.pipe = None
+        """Send anything still queued and close the pipe writer"""
+        with self._lock:
+            self._send_pending()
+            self._closed = True
+            self.pipe = None
+
+
+def _enlarge_pipe(conn):
+    """Grow the kernel buffer of a pipe connection where the OS allows it"""
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        import fcntl
+
+        fcntl.fcntl(
+            conn.fileno(), getattr(fcntl, "F_SETPIPE_SZ", 1031), PIPE_BUFFER_SIZE
+        )
+    except OSError:
+        # Unprivileged processes are capped by /proc/sys/fs/pipe-max-size
+        pass
+
+
+def _probe(endpoint):
+    """Measure round-trip time to the endpoint with a few HEAD requests
+
+    Returns (rtt, retry_after) where retry_after is the delay in seconds the
+    server asked for when throttling (HTTP 429), or None if the probe failed.
+    """
+    import requests
+
+    rtts = []
+    retry_after = None
+    try:
+        with requests.Session() as session:
+            for _ in range(PROBE_ATTEMPTS):
+                start = time.monotonic()
+                response = session.head(endpoint, timeout=PROBE_TIMEOUT)
+                rtts.append(time.monotonic() - start)
+                if response.status_code == 429:
+                    try:
+                        retry_after = float(response.headers.get("Retry-After", 0))
+                    except ValueError:
+                        retry_after = 0.0
+                    break
+    except requests.RequestException:
+        return None
+
+    # The fastest sample reuses the pooled connection and excludes jitter
+    return min(rtts), retry_after
+
+
+def _configured_max_workers():
+    """Worker count set through HF_PARALLEL_DOWNLOADING_WORKERS, if any"""
+    try:
+        return max(1, int(os.environ["HF_PARALLEL_DOWNLOADING_WORKERS"]))
+    except (KeyError, ValueError):
+        return None
+
+
+def _default_max_workers():
+    """Worker count when nothing better is known; downloads are I/O bound"""
+    return min(MAX_WORKERS, _CPU_COUNT * 4)
+
+
+def _adaptive_max_workers(endpoint, fallback, pipe=None):
+    """Pick a worker count from the endpoint's bandwidth-delay product"""
+    probe = _probe(endpoint)
+    if probe is None:
+        return fallback
+
+    rtt, retry_after = probe
+    bdp = ASSUMED_BANDWIDTH * rtt
+    workers = max(MIN_WORKERS, min(MAX_WORKERS, int(round(bdp / REQUEST_CHUNK_SIZE))))
+
+    if retry_after is not None:
+        # The server is rate limiting us: back off and halve the concurrency
+        workers = max(1, workers // 2)
+        delay = min(retry_after, MAX_RETRY_AFTER)
+        if pipe:
+            pipe.send(f"Server is throttling requests, waiting {delay:.0f}s")
+        time.sleep(delay)
+
+    return workers
+
+
+def _preallocate(path, size):
+    """Create path with its final size reserved on disk"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        os.ftruncate(fd, size)
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, size)
+            except OSError:
+                # Not supported by every filesystem; the sparse file still works
+                pass
+    finally:
+        os.close(fd)
+
+
+def _write_at(fd, data, offset):
+    """Write all of data at offset without moving a shared file position"""
+    view = memoryview(data)
+    while view:
+        if hasattr(os, "pwrite"):
+            written = os.pwrite(fd, view, offset)
+        else:
+            # Each range has its own descriptor, so seek + write is safe here
+            os.lseek(fd, offset, os.SEEK_SET)
+            written = os.write(fd, view)
+        view = view[written:]
+        offset += written
+
+
+def _write_range(url, headers, path, start, end, timeout):
+    """Download bytes start..end of url into the same offsets of path"""
+    from huggingface_hub.utils import get_session
+
+    range_headers = {**headers, "Range": f"bytes={start}-{end}"}
+    with get_session().get(
+        url, headers=range_headers, stream=True, timeout=timeout
+    ) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise OSError(f"Server ignored the range request for {url}")
+
+        fd = os.open(path, os.O_WRONLY | getattr(os, "O_BINARY", 0))
+        try:
+            offset = start
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                _write_at(fd, chunk, offset)
+                offset += len(chunk)
+                _add_progress(_progress_done, len(chunk))
+        finally:
+            os.close(fd)
+
+    if offset != end + 1:
+        raise OSError(f"Incomplete range {start}-{end} for {url}")
+
+
+def _verify(path, expected):
+    """Check the sha256 of a downloaded file by re-reading it once"""
+    # file_digest hashes in C with the GIL released, using OpenSSL's SHA-256
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest() == expected
+
+
+def _download_file(url, path, size, sha256, headers, workers, timeout):
+    """Download one file with parallel ranged requests, then verify it
+
+    The ranges are written into path + ".incomplete", which only replaces
+    path once its checksum matches; a failed or cancelled download never
+    leaves a preallocated file with holes under the final name.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    incomplete_path = path + ".incomplete"
+    try:
+        _fetch_ranges(url, incomplete_path, size, sha256, headers, workers, timeout)
+        os.replace(incomplete_path, path)
+    except BaseException:
+        # Also on SystemExit from the SIGTERM handler when cancelled
+        try:
+            os.unlink(incomplete_path)
+        except OSError:
+            pass
+        raise
+
+
+def _fetch_ranges(url, path, size, sha256, headers, workers, timeout):
+    """Fill a preallocated path with parallel ranged requests and verify it"""
+    _preallocate(path, size)
+
+    parts = max(1, min(workers, size // REQUEST_CHUNK_SIZE))
+    step = -(-size // parts)
+    errors = []
+
+    def fetch(start, end):
+        try:
+            _write_range(url, headers, path, start, end, timeout)
+        except Exception as e:
+            errors.append(e)
+
+    # Daemon threads, so a terminated download process exits immediately
+    threads = [
+        threading.Thread(
+            target=fetch, args=(start, min(start + step, size) - 1), daemon=True
+        )
+        for start in range(0, size, step)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    if not _verify(path, sha256):
+        raise OSError(f"Checksum mismatch for {path}")
+
+
+def _pooled_session_factory(workers):
+    """Session factory whose sessions all share one connection pool
+
+    huggingface_hub creates a session per thread; mounting the same adapter
+    on each lets every download thread reuse the open connections. The
+    adapters are the hub's own, so offline mode and request-id tracing work
+    as with its default backend.
+    """
+    import requests
+    from huggingface_hub import constants
+    from huggingface_hub.utils._http import OfflineAdapter, UniqueRequestIdAdapter
+
+    adapter_class = (
+        OfflineAdapter if constants.HF_HUB_OFFLINE else UniqueRequestIdAdapter
+    )
+    adapter = adapter_class(
+        pool_connections=workers, pool_maxsize=workers * 4, max_retries=3
+    )
+
+    def factory():
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    return factory
+
+
+def _hf_transfer_available():
+    """Whether the Rust hf_transfer client can be used for downloads
+
+    Setting HF_HUB_ENABLE_HF_TRANSFER=0 opts out even when it is installed.
+    """
+    if os.environ.get("HF_HUB_ENABLE_HF_TRANSFER") == "0":
+        return False
+    try:
+        import hf_transfer  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _report_files(pipe, filenames):
+    """Send a completion marker for each repo file that is now on disk"""
+    if pipe:
+        for filename in filenames:
+            pipe.send(FILE_MARKER + filename)
+
+
+def _local_files(root):
+    """Yield relative paths of the files under root, skipping hidden entries"""
+    stack = [(root, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, f"{prefix}{entry.name}/"))
+                    else:
+                        yield prefix + entry.name
+        except OSError:
+            pass
+
+
+def _list_repo_files(model_id, repo_type, token, endpoint, pipe=None):
+    """Fetch repo info with file sizes, or None if the listing fails"""
+    from huggingface_hub import HfApi
+
+    try:
+        return HfApi(endpoint=endpoint, token=token).repo_info(
+            model_id, repo_type=repo_type, files_metadata=True
+        )
+    except Exception as e:
+        if pipe:
+            pipe.send(f"Could not list files, downloading without size hints: {e!s}")
+        return None
+
+
+def _split_by_size(siblings):
+    """Split wanted repo files into (small, large) around LARGE_FILE_THRESHOLD"""
+    from huggingface_hub.utils import filter_repo_objects
+
+    small_files, large_files = [], []
+    for sibling in filter_repo_objects(
+        siblings or [],
+        ignore_patterns=IGNORE_PATTERNS,
+        key=lambda sibling: sibling.rfilename,
+    ):
+        if (sibling.size or 0) >= LARGE_FILE_THRESHOLD:
+            large_files.append(sibling)
+        else:
+            small_files.append(sibling)
+    return small_files, large_files
+
+
+def _download_large_files(
+    model_id,
+    repo_type,
+    repo_dir,
+    revision,
+    large_files,
+    token,
+    endpoint,
+    workers,
+    timeout,
+    pipe=None,
+):
+    """Fetch large LFS files with ranged requests ahead of snapshot_download
+
+    Returns the repo paths that were downloaded and verified; anything that
+    fails here is left for snapshot_download to fetch the regular way.
+    """
+    from huggingface_hub import hf_hub_url
+    from huggingface_hub.utils import build_hf_headers
+
+    headers = build_hf_headers(token=token)
+    downloaded = []
+    for sibling in large_files:
+        if not sibling.lfs:
+            continue
+
+        filename = sibling.rfilename
+        path = os.path.join(repo_dir, filename)
+        size = sibling.lfs.size
+        sha256 = sibling.lfs.sha256
+        try:
+            if os.path.exists(path) and os.path.getsize(path) == size:
+                if _verify(path, sha256):
+                    downloaded.append(filename)
+                    continue
+
+            if pipe:
+                pipe.send(f"Downloading {filename} ({size} bytes) in parallel ranges")
+            url = hf_hub_url(
+                model_id,
+                filename,
+                repo_type=repo_type,
+                revision=revision,
+                endpoint=endpoint,
+            )
+            _download_file(url, path, size, sha256, headers, workers, timeout)
+            downloaded.append(filename)
+            if pipe:
+                pipe.send(f"Downloaded and verified {filename}")
+        except Exception as e:
+            if pipe:
+                pipe.send(f"Ranged download of {filename} failed, retrying: {e!s}")
+
+    return downloaded
 
 
 def download_huggingface(
@@ -159,10 +701,16 @@ def download_huggingface(
     endpoint: str = None,
     pipe=None,
     repo_type: str = "model",
+    max_workers: int = None,
 ):
     """HuggingFace platform-specific download logic"""
     try:
-        from huggingface_hub import HfFolder, snapshot_download
+        from huggingface_hub import (
+            HfFolder,
+            configure_http_backend,
+            constants,
+            snapshot_download,
+        )
     except ImportError:
         if pipe:
             pipe.send("Error: HuggingFace Hub library not installed.")
@@ -170,43 +718,131 @@ def download_huggingface(
 
     if token:
         HfFolder.save_token(token)
-        os.environ["HF_TOKEN"] = token
-
-    if endpoint:
-        os.environ["HF_ENDPOINT"] = endpoint
-        if "hf-mirror.com" in endpoint:
-            os.environ["HF_HUB_DISABLE_SSL_VERIFICATION"] = "1"
-        else:
-            os.environ.pop("HF_HUB_DISABLE_SSL_VERIFICATION", None)
-    else:
-        os.environ.pop("HF_HUB_DISABLE_SSL_VERIFICATION", None)
 
-    os.environ["HF_HUB_ENABLE_HF_TRANSFER"] = "0"
-    os.environ["HF_HUB_DOWNLOAD_TIMEOUT"] = "300"
-    os.environ["HF_HUB_ENABLE_CONCURRENT_DOWNLOAD"] = "1"
+    if pipe:
+        logging.getLogger("huggingface_hub").addHandler(PipeLogHandler(pipe))
 
     repo_dir = os.path.join(save_path, model_id.split("/")[-1])
 
     if pipe:
         pipe.send(f"Starting HuggingFace download of {model_id}")
 
-    cpu_count = multiprocessing.cpu_count()
-    max_workers = min(cpu_count + 2, 8)
-
-    result = snapshot_download(
-        repo_id=model_id,
-        repo_type=repo_type,
-        local_dir=repo_dir,
-        token=token,
-        force_download=False,
-        max_workers=max_workers,
-        tqdm_class=UnifiedProgressBar,
-        ignore_patterns=["*.h5", "*.ot", "*.msgpack", "*.bin", "*.pkl", "*.onnx", ".*"],
-        local_files_only=False,
-        etag_timeout=30,
-        proxies=None,
-        endpoint=endpoint,
+    if max_workers is None:
+        max_workers = _configured_max_workers()
+    # A count the caller or user asked for is used as is; only a probed or
+    # default count is raised to the small-file floor
+    small_file_workers = max_workers
+    if max_workers is None:
+        max_workers = _adaptive_max_workers(
+            endpoint or constants.ENDPOINT, _default_max_workers(), pipe
+        )
+        small_file_workers = max(max_workers, SMALL_FILE_WORKERS)
+    # Sized for the busiest pass, so no download thread waits for a connection
+    configure_http_backend(_pooled_session_factory(small_file_workers))
+
+    def run_snapshot(workers, revision=None, allow=None, ignore=()):
+        # Patterns are matched file by file, so allow and ignore lists should
+        # stay short: the few large files, never every small one
+        return snapshot_download(
+            repo_id=model_id,
+            repo_type=repo_type,
+            revision=revision,
+            local_dir=repo_dir,
+            token=token,
+            force_download=False,
+            max_workers=workers,
+            tqdm_class=UnifiedProgressBar,
+            allow_patterns=(None if allow is None else [glob.escape(f) for f in allow]),
+            ignore_patterns=IGNORE_PATTERNS + [glob.escape(f) for f in ignore],
+            local_files_only=False,
+            etag_timeout=30,
+            proxies=None,
+            endpoint=endpoint,
+        )
+
+    # tqdm_class only drives snapshot_download's "Fetching N files" bar; the
+    # byte bar of each file comes from huggingface_hub.utils.tqdm, so that one
+    # is swapped for a bar that reports through the pipe and shared counters
+    hub_tqdm = importlib.import_module("huggingface_hub.utils.tqdm")
+
+    class HubProgressBar(UnifiedProgressBar, hub_tqdm.tqdm):
+        """Per-file huggingface_hub bar that reports like UnifiedProgressBar"""
+
+    # Token and endpoint are passed explicitly; settings without a keyword
+    # argument are read from huggingface_hub.constants at call time
+    saved_constants = (
+        constants.HF_HUB_ENABLE_HF_TRANSFER,
+        constants.HF_HUB_DOWNLOAD_TIMEOUT,
+        hub_tqdm.tqdm,
     )
+    hub_tqdm.tqdm = HubProgressBar
+    use_hf_transfer = _hf_transfer_available()
+    constants.HF_HUB_ENABLE_HF_TRANSFER = use_hf_transfer
+    constants.HF_HUB_DOWNLOAD_TIMEOUT = 300
+    if use_hf_transfer and pipe:
+        pipe.send("Using hf_transfer for file downloads")
+    # Let hf_xet use all cores for Xet-backed repos unless the user set it
+    xet_env = {
+        "HF_XET_HIGH_PERFORMANCE": os.environ.get("HF_XET_HIGH_PERFORMANCE", "1")
+    }
+    with env_override(xet_env):
+        try:
+            info = _list_repo_files(model_id, repo_type, token, endpoint, pipe)
+            if info is None:
+                result = run_snapshot(max_workers)
+                _report_files(pipe, _local_files(result))
+            else:
+                # Many small files are latency bound and want many parallel
+                # requests; large files are bandwidth bound and want only a few
+                small_files, large_files = _split_by_size(info.siblings)
+                sizes = {f.rfilename: f.size or 0 for f in small_files + large_files}
+                # Each pass ends by setting the exact bytes completed so far,
+                # covering files that were already up to date or resumed
+                completed = 0
+                _set_progress(done=0, total=sum(sizes.values()))
+                # hf_transfer already splits each file into concurrent chunks
+                prefetched = []
+                if not use_hf_transfer:
+                    prefetched = _download_large_files(
+                        model_id,
+                        repo_type,
+                        repo_dir,
+                        info.sha,
+                        large_files,
+                        token,
+                        endpoint,
+                        max_workers,
+                        constants.HF_HUB_DOWNLOAD_TIMEOUT,
+                        pipe,
+                    )
+                    completed += sum(sizes[name] for name in prefetched)
+                    _set_progress(done=completed)
+                    _report_files(pipe, prefetched)
+                small_names = [f.rfilename for f in small_files]
+                large_names = [
+                    f.rfilename for f in large_files if f.rfilename not in prefetched
+                ]
+
+                result = repo_dir
+                # The small pass fetches everything except the large files,
+                # the large pass only what the ranged prefetch left over
+                all_large = [f.rfilename for f in large_files]
+                large_file_workers = min(max_workers, LARGE_FILE_WORKERS)
+                for filenames, workers, allow, ignore in (
+                    (small_names, small_file_workers, None, all_large),
+                    (large_names, large_file_workers, large_names, ()),
+                ):
+                    if filenames:
+                        result = run_snapshot(workers, info.sha, allow, ignore)
+                        completed += sum(sizes[name] for name in filenames)
+                        _set_progress(done=completed)
+                        _report_files(pipe, filenames)
+        finally:
+            (
+                constants.HF_HUB_ENABLE_HF_TRANSFER,
+                constants.HF_HUB_DOWNLOAD_TIMEOUT,
+                hub_tqdm.tqdm,
+            ) = saved_constants
 
     if pipe:
         pipe.send(f"HuggingFace download completed: {result}")
@@ -221,16 +857,31 @@ def download_modelscope(
     endpoint: str = None,
     pipe=None,
     repo_type: str = "model",
+    max_workers: int = None,
 ):
     """ModelScope platform-specific download logic"""
     try:
         from modelscope import HubApi, MsDataset
+        from modelscope.hub.callback import ProgressCallback
         from modelscope.hub.snapshot_download import snapshot_download
     except ImportError:
         if pipe:
             pipe.send("Error: ModelScope library not installed.")
         return False
 
+    class PipeProgressCallback(ProgressCallback):
+        """Feeds the byte counters and reports each file once it is written"""
+
+        def __init__(self, filename, file_size):
+            super().__init__(filename, file_size)
+            _add_progress(_progress_total, file_size)
+
+        def update(self, size):
+            _add_progress(_progress_done, size)
+
+        def end(self):
+            _report_files(pipe, [self.filename])
+
     if token:
         try:
             api = HubApi()
@@ -241,8 +892,8 @@ def download_modelscope(
             if pipe:
                 pipe.send(f"ModelScope authentication failed: {e!s}")
 
-    if endpoint:
-        os.environ["MODELSCOPE_ENDPOINT"] = endpoint
+    if pipe:
+        logging.getLogger("modelscope").addHandler(PipeLogHandler(pipe))
 
     repo_name = model_id.split("/")[-1]
     repo_dir = os.path.join(save_path, repo_name)
@@ -254,49 +905,49 @@ def download_modelscope(
         else:
             pipe.send(f"Downloading Model to directory: {repo_dir}")
 
-    try:
-        if repo_type == "dataset":
-            if pipe:
-                pipe.send("Using MsDataset for dataset download...")
+    # The endpoint is handed to ModelScope through the environment
+    ms_env = {"MODELSCOPE_ENDPOINT": endpoint} if endpoint else {}
+    with env_override(ms_env):
+        try:
+            if repo_type == "dataset":
+                if pipe:
+                    pipe.send("Using MsDataset for dataset download...")
 
-            os.makedirs(repo_dir, exist_ok=True)
+                os.makedirs(repo_dir, exist_ok=True)
 
-            MsDataset.load(
-                dataset_name=model_id,
-                cache_dir=repo_dir,
-            )
+                MsDataset.load(
+                    dataset_name=model_id,
+                    cache_dir=repo_dir,
+                )
 
-            if pipe:
-                pipe.send(f"ModelScope dataset loaded and cached to: {repo_dir}")
+                if pipe:
+                    pipe.send(f"ModelScope dataset loaded and cached to: {repo_dir}")
+                    _report_files(pipe, _local_files(repo_dir))
 
-            result = repo_dir
-        else:
-            result = snapshot_download(
-                model_id=model_id,
-                local_dir=repo_dir,
-                revision="master",
-                ignore_patterns=[
-                    "*.h5",
-                    "*.ot",
-                    "*.msgpack",
-                    "*.bin",
-                    "*.pkl",
-                    "*.onnx",
-                    ".*",
-                ],
-            )
+                result = repo_dir
+            else:
+                result = snapshot_download(
+                    model_id=model_id,
+                    local_dir=repo_dir,
+                    revision="master",
+                    ignore_patterns=IGNORE_PATTERNS,
+                    max_workers=max_workers
+                    or _configured_max_workers()
+                    or _default_max_workers(),
+                    progress_callbacks=[PipeProgressCallback],
+                )
 
-        if pipe:
-            pipe.send(f"ModelScope download completed: {result}")
+            if pipe:
+                pipe.send(f"ModelScope download completed: {result}")
 
-        return True
+            return True
 
-    except Exception as e:
-        error_msg = f"ModelScope download failed: {e!s}"
-        if pipe:
-            pipe.send(error_msg)
-        print(f"Error: {error_msg}")
-        return False
+        except Exception as e:
+            error_msg = f"ModelScope download failed: {e!s}"
+            if pipe:
+                pipe.send(f"Error: {error_msg}")
+            print(f"Error: {error_msg}")
+            return False
 
 
 def unified_download_model(
@@ -307,24 +958,20 @@ def unified_download_model(
     endpoint: str = None,
     pipe=None,
     repo_type: str = "model",
+    max_workers: int = None,
 ):
     """Unified download function that delegates to platform-specific implementations"""
     try:
         PLATFORM_CONFIGS[platform]
 
-        print(f"\n=== {platform.title()} Download Process Debug Info ===")
-        print("Process ID:", os.getpid())
-        print("Parent Process ID:", os.getppid())
-        print("Current Working Directory:", os.getcwd())
-        print("Python Executable:", sys.executable)
-        print("Process Start Method:", multiprocessing.get_start_method())
-        print("=== End Debug Info ===\n")
-
-        old_stdout = sys.stdout
-        old_stderr = sys.stderr
-        if pipe:
-            sys.stdout = pipe
-            sys.stderr = pipe
+        if DEBUG:
+            print(f"\n=== {platform.title()} Download Process Debug Info ===")
+            print("Process ID:", os.getpid())
+            print("Parent Process ID:", os.getppid())
+            print("Current Working Directory:", os.getcwd())
+            print("Python Executable:", sys.executable)
+            print("Process Start Method:", multiprocessing.get_start_method())
+            print("=== End Debug Info ===\n")
 
         def signal_handler(signum, frame):
             if pipe:
@@ -338,11 +985,11 @@ def unified_download_model(
             success = False
             if platform == "huggingface":
                 success = download_huggingface(
-                    model_id, save_path, token, endpoint, pipe, repo_type
+                    model_id, save_path, token, endpoint, pipe, repo_type, max_workers
                 )
             elif platform == "modelscope":
                 success = download_modelscope(
-                    model_id, save_path, token, endpoint, pipe, repo_type
+                    model_id, save_path, token, endpoint, pipe, repo_type, max_workers
                 )
             else:
                 if pipe:
@@ -368,10 +1015,8 @@ def unified_download_model(
         return False
     finally:
         if pipe:
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
             try:
-                pipe.send("DOWNLOAD_COMPLETE")
+                pipe.send(COMPLETE_MARKER)
             except (BrokenPipeError, OSError, EOFError):
                 pass
 
@@ -383,40 +1028,48 @@ class ThreadSafeSignalEmitter(QObject):
     error = pyqtSignal(str)
     status = pyqtSignal(str)
     log = pyqtSignal(str)
+    file_completed = pyqtSignal(str)
+    # Bytes done and total; qint64 because downloads outgrow a C int
+    progress = pyqtSignal("qint64", "qint64")
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._mutex = QMutex()
+        # Read without the mutex: a bool assignment is atomic and a late
+        # reader at worst sends one more signal, which Qt queues safely
         self._is_valid = True
         self._parent_ref = weakref.ref(parent) if parent else None
+        self._signals = {
+            "finished": self.finished,
+            "error": self.error,
+            "status": self.status,
+            "log": self.log,
+            "file_completed": self.file_completed,
+            "progress": self.progress,
+        }
 
     def safe_emit(self, signal_name: str, *args):
         """Thread-safe signal emission with object validity checks"""
-        with QMutexLocker(self._mutex):
-            if not self._is_valid:
-                return False
-
-            # Check parent object validity
-            if self._parent_ref:
-                parent = self._parent_ref()
-                if (
-                    parent is None
-                    or not hasattr(parent, "isRunning")
-                    or not parent.isRunning()
-                ):
-                    return False
+        if not self._is_valid:
+            return False
 
-            try:
-                signal = getattr(self, signal_name, None)
-                if signal is not None:
-                    # Use QueuedConnection for cross-thread safety
-                    signal.emit(*args)
-                    return True
-            except (RuntimeError, AttributeError):
-                # Signal target destroyed or unavailable
-                self._is_valid = False
+        # Check parent object validity
+        if self._parent_ref:
+            parent = self._parent_ref()
+            if parent is None or not parent.isRunning():
                 return False
-        return False
+
+        signal = self._signals.get(signal_name)
+        if signal is None:
+            return False
+        try:
+            # Use QueuedConnection for cross-thread safety
+            signal.emit(*args)
+            return True
+        except RuntimeError:
+            # Signal target destroyed
+            self._is_valid = False
+            return False
 
     def invalidate(self):
         """Mark this emitter as invalid to prevent further emissions"""
@@ -424,8 +1077,35 @@ class ThreadSafeSignalEmitter(QObject):
             self._is_valid = False
 
 
-class UnifiedDownloadWorker(QThread):
-    """Unified download worker supporting multiple platforms via configuration"""
+def _get_thread_pool():
+    """Return the shared download thread pool, creating it on first use"""
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = QThreadPool()
+        _thread_pool.setMaxThreadCount(min(8, _CPU_COUNT))
+    return _thread_pool
+
+
+class _DownloadRunnable(QRunnable):
+    """Thread pool task that runs a worker's download"""
+
+    def __init__(self, worker):
+        super().__init__()
+        # The worker owns this runnable, so it must not be deleted by the pool
+        self.setAutoDelete(False)
+        self._worker = worker
+
+    def run(self):
+        self._worker.run()
+
+
+class UnifiedDownloadWorker(QObject):
+    """Unified download worker supporting multiple platforms via configuration
+
+    The worker only carries signals and state; the download itself runs as a
+    task on the shared thread pool. start(), isRunning(), wait(), quit() and
+    terminate() keep the interface callers used when this was a QThread.
+    """
 
     def __init__(
         self,
@@ -435,6 +1115,7 @@ class UnifiedDownloadWorker(QThread):
         token=None,
         endpoint=None,
         repo_type="model",
+        max_workers=None,
     ):
         super().__init__()
 
@@ -448,6 +1129,7 @@ class UnifiedDownloadWorker(QThread):
         self.save_path = save_path
         self.token = token
         self.repo_type = repo_type
+        self.max_workers = max_workers
 
         # Get platform configuration
         self._config = PLATFORM_CONFIGS[platform]
@@ -461,33 +1143,112 @@ class UnifiedDownloadWorker(QThread):
         self.error = self._signal_emitter.error
         self.status = self._signal_emitter.status
         self.log = self._signal_emitter.log
+        self.file_completed = self._signal_emitter.file_completed
+        self.progress = self._signal_emitter.progress
 
         self._logger = logging.getLogger("UnifiedDownloadWorker")
         self._logger.setLevel(logging.DEBUG)
 
-        self.logger_manager = LoggerManager()
-        self.log_handler = self.logger_manager.get_handler(self.log)
+        self.log_handler = LogHandler(self.log)
         self.log_handler.setFormatter(
             logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         )
-
-        platform_logger = logging.getLogger(self._config["logger_name"])
-        platform_logger.addHandler(self.log_handler)
-        self._logger.addHandler(self.log_handler)
-        qt_logger = logging.getLogger("PyQt6")
-        qt_logger.addHandler(self.log_handler)
+        for logger_name in (
+            self._config["logger_name"],
+            "UnifiedDownloadWorker",
+            "PyQt6",
+        ):
+            logging.getLogger(logger_name).addHandler(self.log_handler)
+        # Detach the handler even if cleanup() never runs for this worker
+        weakref.finalize(self, _detach_handler, self.log_handler)
 
         self.repo_name = self.model_id.split("/")[-1]
         self.repo_dir = os.path.join(self.save_path, self.repo_name)
+        # Only huggingface_hub leaves lock files inside the download folder,
+        # in its local_dir metadata cache; ModelScope locks in its own cache
+        self._lock_dir = (
+            os.path.join(self.repo_dir, ".cache", "huggingface")
+            if platform == "huggingface"
+            else None
+        )
         self._logger.debug(f"Initialized {platform} worker for {repo_type}.")
 
         self._cancel_event = threading.Event()
+        # Readable end wakes blocked waiters as soon as a cancel is requested;
+        # opened per run by start() and closed again by cleanup()
+        self._cancel_reader = None
+        self._cancel_writer = None
         self._download_process = None
         self._pipe_reader = None
         self._pipe_writer = None
-        self._output_thread = None
+        self._log_lines = []
+        self._log_bytes = 0
+        self._last_flush = 0.0
+        # First error line from the download process, used as the reason
+        self._first_error = None
+        self._progress_done = None
+        self._progress_total = None
+        self._last_progress = None
         self._is_running = False
-        self._cleanup_timer = None
+
+        self._runnable = _DownloadRunnable(self)
+        self._done = threading.Event()
+        self._done.set()
+
+    def start(self):
+        """Queue the download on the shared thread pool"""
+        if self.isRunning():
+            return
+        self._done.clear()
+        self._cancel_event.clear()
+        # A fresh notifier, so a wake-up left over from the last run (which
+        # always writes one on exit) cannot cancel this one
+        self._close_cancel_notifier()
+        self._cancel_reader, self._cancel_writer = multiprocessing.Pipe(duplex=False)
+        _get_thread_pool().start(self._runnable)
+
+    def isRunning(self):
+        """True from start() until the download task has returned"""
+        return not self._done.is_set()
+
+    def wait(self, msecs=None):
+        """Block until the download task returns or msecs elapse"""
+        return self._done.wait(None if msecs is None else msecs / 1000)
+
+    def quit(self):
+        """Kept for QThread compatibility; pool tasks have no event loop"""
+
+    def terminate(self):
+        """Kill the download process; pool threads themselves can't be killed"""
+        self._notify_cancel()
+        process = self._download_process
+        if process is not None and process.is_alive():
+            try:
+                process.kill()
+            except (OSError, ProcessLookupError):
+                pass
+
+    def _stop_process(self, process):
+        """Terminate the download process, killing it if it doesn't exit"""
+        if process is None or not process.is_alive():
+            return
+        try:
+            process.terminate()
+            # join blocks on the process sentinel until exit or timeout
+            process.join(timeout=3.0)
+
+            if process.is_alive():
+                try:
+                    process.kill()
+                    process.join(timeout=1.0)
+                except (OSError, ProcessLookupError):
+                    pass
+
+            self._logger.debug(f"{self.platform} download process terminated")
+        except Exception as e:
+            self._logger.error(
+                f"Error terminating {self.platform} download process: {e}"
+            )
 
     def _safe_emit(self, signal_name: str, *args):
         """Safe signal emission wrapper"""
@@ -495,38 +1256,56 @@ class UnifiedDownloadWorker(QThread):
 
     @staticmethod
     def _isolated_download_wrapper(
-        platform, model_id, save_path, token, endpoint, pipe, repo_type
+        platform,
+        model_id,
+        save_path,
+        token,
+        endpoint,
+        pipe,
+        repo_type,
+        progress_done=None,
+        progress_total=None,
+        max_workers=None,
     ):
         """Process-isolated download wrapper that doesn't inherit PyQt state"""
-        try:
-            # Create safe pipe writer in the new process
-            safe_pipe = SafePipeWriter(pipe)
+        global _progress_done, _progress_total, _progress_pipe
+        _progress_done = progress_done
+        _progress_total = progress_total
 
+        # Create safe pipe writer in the new process
+        safe_pipe = SafePipeWriter(pipe)
+        _progress_pipe = safe_pipe
+        try:
             # Call the unified download function
-            result = unified_download_model(
-                platform, model_id, save_path, token, endpoint, safe_pipe, repo_type
+            success = unified_download_model(
+                platform,
+                model_id,
+                save_path,
+                token,
+                endpoint,
+                safe_pipe,
+                repo_type,
+                max_workers,
             )
-
-            # Clean up pipe
-            safe_pipe.close()
-
-            return result
         except Exception as e:
-            if pipe:
-                try:
-                    pipe.send(f"Process wrapper error: {e!s}")
-                except (BrokenPipeError, OSError, EOFError):
-                    pass
-            return False
+            safe_pipe.send(f"Process wrapper error: {e!s}")
+            success = False
+        finally:
+            # Sends whatever is still buffered, including the completion marker
+            safe_pipe.close()
+        # The worker only sees the exit code, so a failure must not exit 0
+        if not success:
+            sys.exit(1)
+        return success
 
     def run(self):
-        """QThread run method - this executes in the worker thread"""
+        """Download task body - this executes on a thread pool thread"""
         try:
             self._is_running = True
-            self._cancel_event.clear()
             self._run()
         finally:
             self._is_running = False
+            self._done.set()
 
     def cancel_download(self):
         """Cancel download"""
@@ -535,34 +1314,18 @@ class UnifiedDownloadWorker(QThread):
 
         self._logger.debug(f"Cancel {self.platform} download requested")
 
-        self._cancel_event.set()
-
-        if self._output_thread and self._output_thread.is_alive():
-            try:
-                self._output_thread.join(timeout=1.0)
-            except Exception as e:
-                self._logger.error(f"Error stopping output thread: {e}")
-
-        if self._download_process and self._download_process.is_alive():
-            try:
-                self._download_process.terminate()
-                for _ in range(30):
-                    if not self._download_process.is_alive():
-                        break
-                    time.sleep(0.1)
+        # Taken before the notify, which lets the download thread clean up
+        # and drop its reference
+        process = self._download_process
+        self._notify_cancel()
 
-                if self._download_process.is_alive():
-                    try:
-                        self._download_process.kill()
-                        time.sleep(0.1)
-                    except (OSError, ProcessLookupError):
-                        pass
+        # A download still waiting for a pool thread can simply be dropped
+        if _get_thread_pool().tryTake(self._runnable):
+            self._done.set()
 
-                self._logger.debug(f"{self.platform} download process terminated")
-            except Exception as e:
-                self._logger.error(
-                    f"Error terminating {self.platform} download process: {e}"
-                )
+        self._stop_process(process)
+        # With the process gone the task only has its own cleanup left
+        self.wait(2000)
 
         if hasattr(self, "_signal_emitter"):
             self._signal_emitter.invalidate()
@@ -570,20 +1333,30 @@ class UnifiedDownloadWorker(QThread):
         self.cleanup()
         self._is_running = False
 
-        if hasattr(self, "_cleanup_timer") and self._cleanup_timer:
-            self._cleanup_timer.stop()
-            self._cleanup_timer.deleteLater()
+    def _notify_cancel(self):
+        """Set the cancel event and wake any thread waiting on the notifier"""
+        self._cancel_event.set()
+        if self._cancel_writer is None:
+            return
+        try:
+            self._cancel_writer.send_bytes(b"x")
+        except (OSError, ValueError):
+            pass
 
-        self._cleanup_timer = QTimer()
-        self._cleanup_timer.setSingleShot(True)
-        self._cleanup_timer.timeout.connect(self.quit)
-        self._cleanup_timer.start(100)
+    def _close_cancel_notifier(self):
+        """Close both ends of the cancel notifier pipe, if open"""
+        for conn in (self._cancel_reader, self._cancel_writer):
+            if conn is not None:
+                conn.close()
+        self._cancel_reader = None
+        self._cancel_writer = None
 
     def _run(self):
         """Run download task in isolated thread"""
         try:
             self._logger.debug(f"Starting {self.platform} download worker run")
-            cleanup_lock_files(self.repo_dir)
+            if self._lock_dir:
+                cleanup_lock_files(self._lock_dir)
 
             repo_type_text = "model" if self.repo_type == "model" else "dataset"
             self._safe_emit(
@@ -595,14 +1368,18 @@ class UnifiedDownloadWorker(QThread):
                 f"Starting {self.platform} download {self.model_id} to {self.repo_dir}",
             )
 
-            self._pipe_reader, self._pipe_writer = multiprocessing.Pipe(duplex=False)
+            self._pipe_reader, self._pipe_writer = _mp_context.Pipe(duplex=False)
+            _enlarge_pipe(self._pipe_writer)
+            self._log_lines = []
+            self._log_bytes = 0
+            self._last_flush = time.monotonic()
+            self._first_error = None
 
-            self._output_thread = threading.Thread(
-                target=self._process_pipe_output, daemon=True
-            )
-            self._output_thread.start()
+            self._progress_done = _mp_context.Value("Q", 0)
+            self._progress_total = _mp_context.Value("Q", 0)
+            self._last_progress = None
 
-            self._download_process = multiprocessing.get_context("spawn").Process(
+            self._download_process = process = _mp_context.Process(
                 target=self._isolated_download_wrapper,
                 args=(
                     self.platform,
@@ -612,31 +1389,61 @@ class UnifiedDownloadWorker(QThread):
                     self.endpoint,
                     self._pipe_writer,
                     self.repo_type,
+                    self._progress_done,
+                    self._progress_total,
+                    self.max_workers,
                 ),
             )
-            self._download_process.start()
+            process.start()
+
+            # The child owns the write end now; closing ours lets the reader
+            # see EOF as soon as the download process exits
+            self._pipe_writer.close()
+            self._pipe_writer = None
 
+            # Sleep until output, process exit or a cancel arrives, waking
+            # otherwise only to flush batched output and publish progress
             download_completed = False
-            while self._download_process.is_alive():
-                if self._cancel_event.is_set():
+            reader = self._pipe_reader
+            sentinel = process.sentinel
+            # None when run() was called directly rather than through start()
+            cancel_reader = self._cancel_reader
+            waitables = [reader, sentinel]
+            if cancel_reader is not None:
+                waitables.append(cancel_reader)
+            while True:
+                timeout = PROGRESS_INTERVAL
+                if self._log_lines:
+                    elapsed = time.monotonic() - self._last_flush
+                    timeout = min(timeout, max(0.0, LOG_FLUSH_INTERVAL - elapsed))
+                ready = wait(waitables, timeout)
+                if cancel_reader in ready:
                     self._logger.debug("Cancel event detected, terminating process")
-                    self._download_process.terminate()
+                    # A SIGTERM'd download still waits for its transfer
+                    # threads, so this may have to kill it
+                    self._stop_process(process)
                     break
-                self._download_process.join(timeout=0.1)
+                if reader in ready and not self._read_output():
+                    waitables.remove(reader)
+                if sentinel in ready:
+                    # Output written just before exiting is still in the pipe
+                    while reader in waitables and reader.poll():
+                        if not self._read_output():
+                            break
+                    break
+                self._flush_log()
+                self._report_progress()
+            self._flush_log(force=True)
+            self._report_progress()
 
-            if self._download_process.exitcode == 0:
+            if process.exitcode == 0:
                 download_completed = True
             else:
                 self._logger.debug(
-                    f"{self.platform} exit with code: {self._download_process.exitcode}"
+                    f"{self.platform} exit with code: {process.exitcode}"
                 )
 
-            self._cancel_event.set()
-            if self._output_thread:
-                self._output_thread.join()
-
             if download_completed:
-                cleanup_lock_files(self.repo_dir)
                 repo_type_text = "Model" if self.repo_type == "model" else "Dataset"
                 self._safe_emit(
                     "log",
@@ -647,7 +1454,8 @@ class UnifiedDownloadWorker(QThread):
             elif self._cancel_event.is_set() and not download_completed:
                 raise Exception(f"{self.platform} download cancelled by user")
             else:
-                raise Exception(f"{self.platform} download process failed")
+                reason = f": {self._first_error}" if self._first_error else ""
+                raise Exception(f"{self.platform} download process failed{reason}")
 
         except Exception as e:
             error_msg = str(e)
@@ -658,36 +1466,58 @@ class UnifiedDownloadWorker(QThread):
             self._logger.debug(f"{self.platform} download worker run completed")
             self._is_running = False
             if hasattr(self, "_cancel_event"):
-                self._cancel_event.set()
-            if (
-                hasattr(self, "_output_thread")
-                and self._output_thread
-                and self._output_thread.is_alive()
-            ):
-                self._output_thread.join(timeout=1.0)
+                self._notify_cancel()
             self.cleanup()
 
-    def _process_pipe_output(self):
-        """Process pipe output in thread"""
-        while not self._cancel_event.is_set():
-            try:
-                if self._pipe_reader and self._pipe_reader.poll(0.01):
-                    try:
-                        output = self._pipe_reader.recv()
-                        if output == "DOWNLOAD_COMPLETE":
-                            break
-                        # Use safe signal emission
-                        self._safe_emit("log", str(output))
-                    except EOFError:
-                        break
-                    except Exception as e:
-                        self._logger.error(
-                            f"Error processing {self.platform} pipe output: {e}"
-                        )
-                        continue
-            except Exception as e:
-                self._logger.error(f"Critical error in pipe output processing: {e}")
-                break
+    def _report_progress(self):
+        """Emit aggregate byte progress from the shared counters on change"""
+        if self._progress_done is None or self._progress_total is None:
+            return
+        progress = (self._progress_done.value, self._progress_total.value)
+        if progress[1] and progress != self._last_progress:
+            self._last_progress = progress
+            self._safe_emit("progress", *progress)
+
+    def _read_output(self):
+        """Read one frame from the pipe into the pending log batch
+
+        Returns False once the download process has closed the pipe or sent
+        the completion marker.
+        """
+        try:
+            frame = self._pipe_reader.recv_bytes().decode("utf-8", "replace")
+        except EOFError:
+            return False
+        except Exception as e:
+            self._logger.error(f"Error processing {self.platform} pipe output: {e}")
+            return True
+        for output in frame.split("\n"):
+            if output == COMPLETE_MARKER:
+                return False
+            if output.startswith(FILE_MARKER):
+                self._safe_emit("file_completed", output[len(FILE_MARKER) :])
+                continue
+            if self._first_error is None and output.startswith("Error"):
+                self._first_error = output
+            self._log_lines.append(output)
+            self._log_bytes += len(output)
+        return True
+
+    def _flush_log(self, force=False):
+        """Forward the pending log batch to the GUI once it is due"""
+        if not self._log_lines:
+            return
+        now = time.monotonic()
+        if (
+            force
+            or len(self._log_lines) > LOG_FLUSH_LINES
+            or self._log_bytes >= LOG_FLUSH_BYTES
+            or now - self._last_flush >= LOG_FLUSH_INTERVAL
+        ):
+            self._safe_emit("log", "\n".join(self._log_lines))
+            self._log_lines = []
+            self._log_bytes = 0
+            self._last_flush = now
 
     def cleanup(self):
         """Enhanced resource cleanup ensuring complete release"""
@@ -696,26 +1526,6 @@ class UnifiedDownloadWorker(QThread):
         try:
             self._logger.debug(f"Starting {self.platform} comprehensive cleanup")
 
-            current_endpoint = os.environ.get(self._config["endpoint_env"])
-
-            try:
-                cleanup_environment()
-                os.environ.pop(self._config["token_env"], None)
-                os.environ.pop(self._config["endpoint_env"], None)
-                if self.platform == "huggingface":
-                    os.environ.pop("HF_HUB_DISABLE_SSL_VERIFICATION", None)
-                    os.environ.pop("HF_HUB_ENABLE_HF_TRANSFER", None)
-                    os.environ.pop("HF_HUB_DOWNLOAD_TIMEOUT", None)
-                    os.environ.pop("HF_HUB_ENABLE_CONCURRENT_DOWNLOAD", None)
-                self._logger.debug(f"{self.platform} environment variables cleaned")
-            except Exception as e:
-                cleanup_errors.append(
-                    f"{self.platform} environment cleanup failed: {e}"
-                )
-
-            if current_endpoint:
-                os.environ[self._config["endpoint_env"]] = current_endpoint
-
             try:
                 if hasattr(self, "_pipe_reader") and self._pipe_reader:
                     self._pipe_reader.close()
@@ -726,8 +1536,8 @@ class UnifiedDownloadWorker(QThread):
                 cleanup_errors.append(f"{self.platform} pipe cleanup failed: {e}")
 
             try:
-                if hasattr(self, "logger_manager"):
-                    self.logger_manager.cleanup_handler(self.log)
+                if hasattr(self, "log_handler"):
+                    _detach_handler(self.log_handler)
                     self._logger.debug(f"{self.platform} log handlers removed")
             except Exception as e:
                 cleanup_errors.append(
@@ -735,16 +1545,23 @@ class UnifiedDownloadWorker(QThread):
                 )
 
             try:
-                cleanup_lock_files(self.repo_dir)
-                self._logger.debug(f"{self.platform} lock files cleaned up")
+                if self._lock_dir:
+                    cleanup_lock_files(self._lock_dir)
+                    self._logger.debug(f"{self.platform} lock files cleaned up")
             except Exception as e:
                 cleanup_errors.append(f"{self.platform} lock file cleanup failed: {e}")
 
+            # The download thread may still be waiting on the notifier when
+            # cancel_download cleans up; its own cleanup closes it then
+            if not self._is_running:
+                self._close_cancel_notifier()
+
             self._is_running = False
             self._download_process = None
             self._pipe_reader = None
             self._pipe_writer = None
-            self._output_thread = None
+            self._progress_done = None
+            self._progress_total = None
 
             try:
                 if hasattr(self, "_signal_emitter"):
@@ -4,6 +4,7 @@ Utility functions for the Model Downloader
 
 import logging
 import os
+from contextlib import contextmanager
 
 logger = logging.getLogger("huggingface_hub")
 logger.setLevel(logging.INFO)
@@ -12,23 +13,45 @@ logger.setLevel(logging.INFO)
 def cleanup_lock_files(directory):
     """Clean up any .lock files in the directory and its subdirectories."""
     logger.info("Cleaning up lock files (keeping downloaded chunks for resume)...")
-    try:
-        for root, _dirs, files in os.walk(directory):
-            for file in files:
-                if file.endswith(".lock"):
-                    lock_file = os.path.join(root, file)
-                    try:
-                        os.remove(lock_file)
-                        logger.info(f"Removed lock file: {lock_file}")
-                    except Exception as e:
-                        logger.warning(f"Could not remove lock file {lock_file}: {e!s}")
-    except Exception as e:
-        logger.warning(f"Error while cleaning lock files: {e!s}")
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".lock"):
+                        try:
+                            os.unlink(entry.path)
+                            logger.info(f"Removed lock file: {entry.path}")
+                        except OSError as e:
+                            logger.warning(
+                                f"Could not remove lock file {entry.path}: {e!s}"
+                            )
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Error while cleaning lock files in {current}: {e!s}")
+
 
+@contextmanager
+def env_override(values):
+    """Set environment variables for the duration of a block.
 
-def cleanup_environment():
-    """Clean up environment variables."""
-    env_vars = ["HF_TOKEN", "HF_HUB_DISABLE_SSL_VERIFICATION"]
-    for var in env_vars:
-        if var in os.environ:
-            del os.environ[var]
+    A value of None removes the variable; previous values are restored on exit.
+    """
+    saved = {key: os.environ.get(key) for key in values}
+    try:
+        for key, value in values.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
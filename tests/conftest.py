@@ -0,0 +1,238 @@
+"""
+Shared fixtures for the E2E tests
+"""
+
+import functools
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from PyQt6.QtCore import QCoreApplication
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qapp():
+    """One Qt application for the whole test session
+
+    The worker only needs an event loop, so a QCoreApplication avoids loading
+    the GUI platform plugin on headless machines.
+    """
+    return QCoreApplication.instance() or QCoreApplication(sys.argv)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def hf_cache(tmp_path_factory):
+    """Point the hub caches at a test cache directory
+
+    Set HF_TEST_CACHE to a persistent path to keep the caches, including the
+    Xet chunk cache, between runs. Must run before the first download starts
+    the forkserver, which inherits the environment at that point.
+    """
+    cache = Path(os.environ.get("HF_TEST_CACHE") or tmp_path_factory.mktemp("hfcache"))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HF_HOME", str(cache))
+        mp.setenv("HF_HUB_CACHE", str(cache / "hub"))
+        mp.setenv("MODELSCOPE_CACHE", str(cache / "modelscope"))
+        yield cache
+
+
+MODELSCOPE_PROBE_URL = (
+    "https://www.modelscope.cn/api/v1/models/damo/nlp_bert_base-chinese"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def modelscope_skip_reason():
+    """Probe ModelScope once, returning why its tests can't run or None"""
+    import requests
+
+    try:
+        response = requests.get(MODELSCOPE_PROBE_URL, timeout=2)
+    except requests.RequestException as e:
+        return f"ModelScope is unreachable: {e}"
+    if response.status_code in (401, 403) or response.status_code >= 500:
+        return f"ModelScope probe returned HTTP {response.status_code}"
+    return None
+
+
+@pytest.fixture(scope="session")
+def modelscope_available():
+    """Skip ModelScope tests up front when the hub is unreachable or refuses us"""
+    reason = modelscope_skip_reason()
+    if reason:
+        pytest.skip(reason)
+    return True
+
+
+FAKE_COMMIT = "0123456789abcdef0123456789abcdef01234567"
+FAKE_CHUNK_SIZE = 64 * 1024
+
+
+class _FakeHubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def _respond(self, send_body):
+        path = self.path.split("?", 1)[0]
+        if path == "/":
+            self._send(200, b"", "text/plain", send_body)
+        elif path.startswith("/api/models/"):
+            self._send_info(path[len("/api/models/") :].split("/revision/")[0])
+        elif "/resolve/" in path:
+            repo_id, rest = path[1:].split("/resolve/", 1)
+            self._send_file(repo_id, rest.split("/", 1)[-1], send_body)
+        else:
+            self._send(404, b"Not found", "text/plain", send_body)
+
+    def _send(self, status, body, content_type, send_body=True, error_code=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if error_code:
+            # huggingface_hub picks the exception type from this header
+            self.send_header("X-Error-Code", error_code)
+            self.send_header("X-Error-Message", body.decode())
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _send_info(self, repo_id):
+        files = self.server.repos.get(repo_id)
+        if files is None:
+            self._send(404, b"Repository not found", "text/plain", True, "RepoNotFound")
+            return
+        info = {
+            "id": repo_id,
+            "sha": FAKE_COMMIT,
+            "siblings": [
+                {
+                    "rfilename": name,
+                    "size": _file_size(content),
+                    # Every file is served as if stored in LFS
+                    "lfs": {
+                        "size": _file_size(content),
+                        "sha256": self.server.sha256_overrides.get(
+                            (repo_id, name), _sha256(content)
+                        ),
+                        "pointerSize": 134,
+                    },
+                }
+                for name, content in files.items()
+            ],
+        }
+        self._send(200, json.dumps(info).encode(), "application/json")
+
+    def _send_file(self, repo_id, filename, send_body):
+        files = self.server.repos.get(repo_id)
+        if files is None:
+            self._send(
+                404, b"Repository not found", "text/plain", send_body, "RepoNotFound"
+            )
+            return
+        content = files.get(filename)
+        if content is None:
+            self._send(
+                404, b"Entry not found", "text/plain", send_body, "EntryNotFound"
+            )
+            return
+        size = _file_size(content)
+        start, end = 0, size - 1
+        byte_range = self.headers.get("Range")
+        self.server.requests.append((self.command, filename, byte_range))
+        if byte_range and byte_range.startswith("bytes="):
+            first, _, last = byte_range[len("bytes=") :].partition("-")
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(end + 1 - start))
+        etag = hashlib.sha1(f"{repo_id}/{filename}/{size}".encode()).hexdigest()
+        self.send_header("ETag", f'"{etag}"')
+        self.send_header("X-Repo-Commit", FAKE_COMMIT)
+        self.end_headers()
+        if not send_body:
+            return
+        try:
+            for offset in range(start, end + 1, FAKE_CHUNK_SIZE):
+                stop = min(offset + FAKE_CHUNK_SIZE, end + 1)
+                if isinstance(content, bytes):
+                    self.wfile.write(content[offset:stop])
+                else:
+                    self.wfile.write(bytes(stop - offset))
+                if self.server.chunk_delay:
+                    time.sleep(self.server.chunk_delay)
+        except (BrokenPipeError, ConnectionResetError):
+            # The download process was cancelled mid-transfer
+            pass
+
+
+def _file_size(content):
+    return len(content) if isinstance(content, bytes) else content
+
+
+@functools.lru_cache(maxsize=None)
+def _sha256(content):
+    """sha256 of a served file, hashing zero-filled files chunk by chunk"""
+    if isinstance(content, bytes):
+        return hashlib.sha256(content).hexdigest()
+    digest = hashlib.sha256()
+    zeros = bytes(FAKE_CHUNK_SIZE * 16)
+    for offset in range(0, content, len(zeros)):
+        digest.update(zeros[: min(len(zeros), content - offset)])
+    return digest.hexdigest()
+
+
+class FakeHub(ThreadingHTTPServer):
+    """Local stand-in for the HuggingFace Hub serving in-memory repos
+
+    Each repo maps file names to their bytes, or to a size for zero-filled
+    files. Files are listed with LFS metadata and honour Range requests. Set
+    chunk_delay to throttle file bodies, and sha256_overrides to advertise a
+    different checksum for a (repo, file). Each file request is recorded in
+    requests as (method, file, Range header or None).
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _FakeHubHandler)
+        self.repos = {}
+        self.chunk_delay = 0.0
+        self.sha256_overrides = {}
+        self.requests = []
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture
+def fake_hub():
+    """A FakeHub running on a background thread"""
+    server = FakeHub()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -3,256 +3,399 @@ Basic E2E tests for download functionality
 Tests with real networks but uses small models/datasets for speed
 """
 
+import importlib.util
+import logging
 import os
+import re
+import shutil
 import sys
 import tempfile
+import time
 
 import pytest
 
 # Add src to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from PyQt6.QtCore import QEventLoop, QTimer
-from PyQt6.QtWidgets import QApplication
-
-from src.unified_downloader import UnifiedDownloadWorker
+from PyQt6.QtCore import QCoreApplication, QTimer
+from PyQt6.QtTest import QSignalSpy
+
+from tests.conftest import modelscope_skip_reason
+
+
+def _lazy_import(name):
+    """Import a module whose body only runs on first attribute access"""
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# Deferred so collecting or deselecting these tests does not load the worker
+unified_downloader = _lazy_import("src.unified_downloader")
+
+logger = logging.getLogger(__name__)
+
+# Errors meaning the download needs credentials, and errors for missing repos
+_AUTH_ERR_RE = re.compile(
+    r"authentication|access|permission|token|forbidden|unauthori[sz]ed", re.I
+)
+_NOTFOUND_RE = re.compile(r"not found|does not exist|404", re.I)
+
+
+# Downloads go to RAM when /dev/shm has room for them, otherwise to disk
+SHM_DIR = "/dev/shm"
+SHM_MIN_FREE = 512 * 1024 * 1024
+
+
+def _download_root():
+    """Directory to create per-test download folders in"""
+    try:
+        if shutil.disk_usage(SHM_DIR).free >= SHM_MIN_FREE:
+            return SHM_DIR
+    except OSError:
+        pass
+    return None
+
+
+# Served by the fake hub; .bin weights are in IGNORE_PATTERNS, so the
+# weights use safetensors
+SYNTHETIC_MODEL = {
+    "config.json": b'{"model_type": "bert", "hidden_size": 32}',
+    "model.safetensors": bytes(range(256)) * 64,
+    "tokenizer.json": b'{"version": "1.0", "model": {"type": "WordPiece"}}',
+}
+
+# A worker with no status, log or progress output for this long is stalled
+STALL_TIMEOUT_MS = 15000
+
+
+def wait_for_all(workers, timeout_ms, stall_ms=STALL_TIMEOUT_MS):
+    """Start the workers and wait until each finishes, fails, stops or times out
+
+    The workers download concurrently on the shared thread pool while this
+    loop drives the one Qt event loop for all of them. The wait ends early
+    once every remaining worker has been silent for stall_ms; pass None to
+    wait out the full timeout. Returns one (finished, error message or None)
+    per worker. Workers still running on a timeout are cancelled and their
+    message says whether they stalled or ran into the deadline.
+    """
+    spies = [
+        (
+            QSignalSpy(worker.finished),
+            QSignalSpy(worker.error),
+            (
+                QSignalSpy(worker.status),
+                QSignalSpy(worker.log),
+                QSignalSpy(worker.progress),
+            ),
+        )
+        for worker in workers
+    ]
+    for worker in workers:
+        worker.start()
 
-# Create QApplication (required for pytest)
-app = QApplication.instance() or QApplication(sys.argv)
+    def pending():
+        return [
+            (worker, finished_spy)
+            for worker, (finished_spy, error_spy, _) in zip(workers, spies)
+            if not len(finished_spy) and not len(error_spy) and worker.isRunning()
+        ]
+
+    # Wait in short slices so an error, or a cancelled worker that emits
+    # nothing, ends the wait as early as finishing
+    last_activity = time.monotonic()
+    deadline = last_activity + timeout_ms / 1000
+    seen = 0
+    timeout_reason = None
+    while waiting := pending():
+        now = time.monotonic()
+        activity = sum(len(spy) for *_, watched in spies for spy in watched)
+        if activity != seen:
+            seen, last_activity = activity, now
+        if now >= deadline:
+            timeout_reason = f"deadline: no result after {timeout_ms / 1000:.0f}s"
+            break
+        if stall_ms is not None and now - last_activity >= stall_ms / 1000:
+            timeout_reason = f"stalled: no activity for {stall_ms / 1000:.0f}s"
+            break
+        waiting[0][1].wait(min(100, int((deadline - now) * 1000) + 1))
+    # Deliver signals queued just before the workers stopped
+    QCoreApplication.processEvents()
+
+    results = []
+    for worker, (finished_spy, error_spy, _) in zip(workers, spies):
+        error_msg = error_spy[0][0] if len(error_spy) else None
+        if timeout_reason and not len(finished_spy) and error_msg is None:
+            worker.cancel_download()
+            error_msg = timeout_reason
+        if error_msg:
+            logger.debug("Download error: %s", error_msg)
+        results.append((len(finished_spy) > 0, error_msg))
+    return results
+
+
+def wait_for(worker, timeout_ms, stall_ms=STALL_TIMEOUT_MS):
+    """Start one worker and wait for its result, see wait_for_all"""
+    return wait_for_all([worker], timeout_ms, stall_ms)[0]
+
+
+def run_workers(jobs, timeout_ms, stall_ms=STALL_TIMEOUT_MS):
+    """Run one worker per job dict of UnifiedDownloadWorker arguments at once
+
+    Returns one (finished, error message or None, repo files the worker
+    reported as completed) per job.
+    """
+    workers = [unified_downloader.UnifiedDownloadWorker(**job) for job in jobs]
+    files_seen = [set() for _ in workers]
+    for worker, files in zip(workers, files_seen):
+        worker.file_completed.connect(files.add)
+    results = wait_for_all(workers, timeout_ms, stall_ms)
+    return [(*result, files) for result, files in zip(results, files_seen)]
+
+
+def run_worker(
+    platform, model_id, save_path, timeout_ms, stall_ms=STALL_TIMEOUT_MS, **kwargs
+):
+    """Create a worker for one download and drive it to a result"""
+    job = dict(platform=platform, model_id=model_id, save_path=save_path, **kwargs)
+    return run_workers([job], timeout_ms, stall_ms)[0]
+
+
+@pytest.fixture
+def temp_dir():
+    """Create temporary download directory"""
+    with tempfile.TemporaryDirectory(dir=_download_root()) as tmpdir:
+        yield tmpdir
 
 
 class TestBasicE2E:
     """Basic end-to-end tests - verify download functionality works"""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary download directory"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield tmpdir
+    def test_huggingface_tiny_model(self, temp_dir, fake_hub):
+        """Test downloading a synthetic 3-file model from a local hub"""
+        fake_hub.repos["fake/tiny"] = SYNTHETIC_MODEL
 
-    def test_huggingface_tiny_model(self, temp_dir):
-        """Test downloading a very small HuggingFace model"""
-        worker = UnifiedDownloadWorker(
-            platform="huggingface",
-            model_id="hf-internal-testing/tiny-random-bert",
-            save_path=temp_dir,
-            repo_type="model",
+        success, error_msg, files_seen = run_worker(
+            "huggingface", "fake/tiny", temp_dir, 30000, endpoint=fake_hub.url
         )
 
-        # Use event loop to wait for download completion
-        loop = QEventLoop()
-        success = False
-        error_msg = None
-
-        def on_finished():
-            nonlocal success
-            success = True
-            loop.quit()
-
-        def on_error(msg):
-            nonlocal error_msg
-            error_msg = msg
-            print(f"Download error: {msg}")
-            loop.quit()
-
-        worker.finished.connect(on_finished)
-        worker.error.connect(on_error)
-
-        # Set timeout (30 seconds)
-        QTimer.singleShot(30000, loop.quit)
-
-        worker.start()
-        loop.exec()
-
         if not success:
             pytest.fail(f"HuggingFace model download failed: {error_msg}")
 
-        # Verify files were downloaded
-        download_path = os.path.join(temp_dir, "tiny-random-bert")
-        assert os.path.exists(download_path), (
-            f"Download directory not created at {download_path}"
+        assert files_seen == set(SYNTHETIC_MODEL)
+        download_path = os.path.join(temp_dir, "tiny")
+        for name, content in SYNTHETIC_MODEL.items():
+            with open(os.path.join(download_path, name), "rb") as f:
+                assert f.read() == content, f"{name} downloaded incorrectly"
+        logger.info("Downloaded %d files to %s", len(SYNTHETIC_MODEL), download_path)
+
+    @pytest.mark.online
+    def test_modelscope_dataset(self, temp_dir, modelscope_available):
+        """Test downloading a small dataset from ModelScope"""
+        # MsDataset reports no progress, so only the deadline applies
+        success, error_msg, files_seen = run_worker(
+            "modelscope",
+            "modelscope/chinese-text-classification-dataset",
+            temp_dir,
+            60000,
+            stall_ms=None,
+            repo_type="dataset",
         )
 
-        # Check if some files exist (should have config.json or similar)
-        files = os.listdir(download_path)
-        assert len(files) > 0, f"No files downloaded to {download_path}"
-        print(f"✅ Downloaded {len(files)} files to {download_path}")
-
-    def test_modelscope_model(self, temp_dir):
-        """Test downloading ModelScope model (test the fix)"""
-        worker = UnifiedDownloadWorker(
-            platform="modelscope",
-            model_id="damo/nlp_bert_base-chinese",  # Small Chinese BERT
-            save_path=temp_dir,
-            repo_type="model",
-        )
-
-        loop = QEventLoop()
-        success = False
-        error_msg = None
-
-        def on_finished():
-            nonlocal success
-            success = True
-            loop.quit()
-
-        def on_error(msg):
-            nonlocal error_msg
-            error_msg = msg
-            print(f"Download error: {msg}")
-            loop.quit()
-
-        worker.finished.connect(on_finished)
-        worker.error.connect(on_error)
-
-        QTimer.singleShot(60000, loop.quit)  # 60 seconds for ModelScope
-
-        worker.start()
-        loop.exec()
-
         if not success:
             # ModelScope might require authentication, skip if needed
-            if (
-                "authentication" in str(error_msg).lower()
-                or "access" in str(error_msg).lower()
-            ):
-                pytest.skip(
-                    f"ModelScope model download requires authentication: {error_msg}"
-                )
-            else:
-                pytest.fail(f"ModelScope model download failed: {error_msg}")
-
-        download_path = os.path.join(temp_dir, "nlp_bert_base-chinese")
-        assert os.path.exists(download_path), "Model directory not created"
-        print(f"✅ ModelScope model downloaded to {download_path}")
-
-    def test_modelscope_dataset(self, temp_dir):
-        """Test downloading ModelScope dataset (this is what we fixed)"""
-        worker = UnifiedDownloadWorker(
-            platform="modelscope",
-            model_id="modelscope/chinese-text-classification-dataset",
-            save_path=temp_dir,
-            repo_type="dataset",  # KEY: Testing dataset type
-        )
-
-        loop = QEventLoop()
-        success = False
-        error_msg = None
-
-        def on_finished():
-            nonlocal success
-            success = True
-            loop.quit()
-
-        def on_error(msg):
-            nonlocal error_msg
-            error_msg = msg
-            print(f"Download error: {msg}")
-            loop.quit()
-
-        worker.finished.connect(on_finished)
-        worker.error.connect(on_error)
-
-        QTimer.singleShot(60000, loop.quit)  # 60 seconds timeout
-
-        worker.start()
-        loop.exec()
-
-        if not success:
-            # If ModelScope requires authentication, mark as skip
-            if any(
-                keyword in str(error_msg).lower()
-                for keyword in ["authentication", "access", "permission", "token"]
-            ):
+            if _AUTH_ERR_RE.search(error_msg or ""):
                 pytest.skip(
                     f"ModelScope dataset download requires authentication: {error_msg}"
                 )
-            else:
-                pytest.fail(f"ModelScope dataset download failed: {error_msg}")
+            pytest.fail(f"ModelScope dataset download failed: {error_msg}")
 
         download_path = os.path.join(temp_dir, "chinese-text-classification-dataset")
-        assert os.path.exists(download_path), "Dataset directory not created"
-        print(f"✅ ModelScope dataset downloaded to {download_path}")
-
-    def test_cancel_download(self, temp_dir):
+        assert files_seen, f"No files reported for {download_path}"
+        logger.info("Downloaded %d files to %s", len(files_seen), download_path)
+
+    @pytest.mark.online
+    def test_both_platforms(self, temp_dir):
+        """Test small models from both hubs downloading at the same time
+
+        The HuggingFace download always runs and is always checked; only the
+        ModelScope part is skipped when ModelScope is unavailable or needs
+        authentication.
+        """
+        jobs = [
+            dict(
+                platform="huggingface",
+                model_id="hf-internal-testing/tiny-random-bert",
+                save_path=temp_dir,
+                max_workers=16,  # Many tiny files, fetch them all at once
+            ),
+        ]
+        skip_reason = modelscope_skip_reason()
+        if not skip_reason:
+            jobs.append(
+                dict(
+                    platform="modelscope",
+                    model_id="damo/nlp_bert_base-chinese",  # Small Chinese BERT
+                    save_path=temp_dir,
+                )
+            )
+
+        # ModelScope is silent while it resolves the repo, so only the
+        # deadline applies
+        results = run_workers(jobs, 60000, stall_ms=None)
+
+        for job, (success, error_msg, files_seen) in zip(jobs, results):
+            platform = job["platform"]
+            if not success:
+                # ModelScope might require authentication, skip if needed
+                if platform == "modelscope" and _AUTH_ERR_RE.search(error_msg or ""):
+                    skip_reason = (
+                        "ModelScope model download requires authentication: "
+                        f"{error_msg}"
+                    )
+                    continue
+                pytest.fail(f"{platform} model download failed: {error_msg}")
+            assert files_seen, f"No files reported for {job['model_id']}"
+            logger.info("Downloaded %d %s files", len(files_seen), platform)
+
+        if skip_reason:
+            # The HuggingFace download above has passed by now
+            pytest.skip(f"ModelScope part skipped: {skip_reason}")
+
+    def test_cancel_download(self, temp_dir, fake_hub):
         """Test download cancellation functionality"""
-        worker = UnifiedDownloadWorker(
+        # A throttled local file that cannot finish before the cancel
+        fake_hub.repos["test/slow-model"] = {"model.safetensors": 64 * 1024 * 1024}
+        fake_hub.chunk_delay = 0.1
+
+        worker = unified_downloader.UnifiedDownloadWorker(
             platform="huggingface",
-            model_id="bert-base-uncased",  # Larger model to have time to cancel
+            model_id="test/slow-model",
             save_path=temp_dir,
+            endpoint=fake_hub.url,
             repo_type="model",
         )
 
-        loop = QEventLoop()
-        cancelled = False
-        error_msg = None
+        # Cancel after 2 seconds
+        QTimer.singleShot(2000, worker.cancel_download)
+        start = time.monotonic()
+        success, error_msg = wait_for(worker, 10000)  # 10 seconds timeout
+        elapsed = time.monotonic() - start
 
-        def on_error(msg):
-            nonlocal cancelled, error_msg
-            error_msg = msg
-            if "cancelled" in msg.lower() or "stopped" in msg.lower():
-                cancelled = True
-            loop.quit()
+        assert not success, "Download should not finish after being cancelled"
+        assert not worker.isRunning(), "Worker still running after cancel"
+        assert elapsed < 8, f"Cancel took {elapsed:.1f}s to stop the worker"
+        logger.info("Download cancelled after %.1fs", elapsed)
 
-        def on_finished():
-            # If download finishes quickly, that's also OK
-            loop.quit()
+    def test_invalid_model_id(self, temp_dir, fake_hub):
+        """Test error handling with invalid model ID"""
+        # The fake hub answers 404 for any repo it does not serve
+        success, error_msg, _ = run_worker(
+            "huggingface",
+            "definitely/does-not-exist-12345",  # Invalid model
+            temp_dir,
+            30000,
+            endpoint=fake_hub.url,
+        )
 
-        worker.error.connect(on_error)
-        worker.finished.connect(on_finished)
-        worker.start()
+        assert not success, "Download of a missing repo should not finish"
+        assert error_msg is not None, "Should have gotten an error for invalid model ID"
+        assert _NOTFOUND_RE.search(error_msg)
+        logger.info("Correctly handled invalid model ID: %s", error_msg)
 
-        # Cancel after 2 seconds
-        QTimer.singleShot(2000, worker.cancel_download)
-        QTimer.singleShot(10000, loop.quit)  # 10 seconds timeout
 
-        loop.exec()
+class TestHuggingFaceDownload:
+    """download_huggingface run in the test process against the fake hub
 
-        # Either cancelled or finished quickly (both are acceptable)
-        if not cancelled:
-            print(f"⚠️  Download may have completed too quickly to cancel: {error_msg}")
-            # This is not a failure - just means the download was very fast
-        else:
-            print("✅ Download cancelled successfully")
+    The worker's download processes come from a forkserver started with the
+    environment of its first use, so settings read at import time are tested
+    here instead.
+    """
 
-    def test_invalid_model_id(self, temp_dir):
-        """Test error handling with invalid model ID"""
-        worker = UnifiedDownloadWorker(
-            platform="huggingface",
-            model_id="definitely/does-not-exist-12345",  # Invalid model
-            save_path=temp_dir,
-            repo_type="model",
+    @pytest.fixture(autouse=True)
+    def http_backend(self):
+        """Restore huggingface_hub's default HTTP backend afterwards"""
+        from huggingface_hub import configure_http_backend
+
+        yield
+        configure_http_backend()
+
+    def test_progress_bars_disabled(self, temp_dir, fake_hub, monkeypatch):
+        """Test a download with HF_HUB_DISABLE_PROGRESS_BARS=1 set"""
+        hub_tqdm = importlib.import_module("huggingface_hub.utils.tqdm")
+        monkeypatch.setenv("HF_HUB_DISABLE_PROGRESS_BARS", "1")
+        # huggingface_hub reads the variable once, when it is imported
+        monkeypatch.setattr(hub_tqdm, "HF_HUB_DISABLE_PROGRESS_BARS", True)
+        fake_hub.repos["fake/tiny"] = SYNTHETIC_MODEL
+
+        assert unified_downloader.download_huggingface(
+            "fake/tiny", temp_dir, endpoint=fake_hub.url, max_workers=4
         )
 
-        loop = QEventLoop()
-        got_error = False
-        error_msg = None
+        for name, content in SYNTHETIC_MODEL.items():
+            with open(os.path.join(temp_dir, "tiny", name), "rb") as f:
+                assert f.read() == content, f"{name} downloaded incorrectly"
+
+    def test_session_factory_keeps_hub_adapters(self, monkeypatch):
+        """Test pooled sessions keep request ids and honour offline mode"""
+        from huggingface_hub import constants
+        from huggingface_hub.errors import OfflineModeIsEnabled
+        from huggingface_hub.utils._http import UniqueRequestIdAdapter
+
+        session = unified_downloader._pooled_session_factory(4)()
+        adapter = session.get_adapter("https://huggingface.co")
+        assert isinstance(adapter, UniqueRequestIdAdapter)
+
+        monkeypatch.setattr(constants, "HF_HUB_OFFLINE", True)
+        session = unified_downloader._pooled_session_factory(4)()
+        with pytest.raises(OfflineModeIsEnabled):
+            session.get("https://huggingface.co")
+
+    def _download_large(self, temp_dir, fake_hub):
+        """Download a repo with one zero-filled file at the large threshold
+
+        Returns the local path of the large file and the fake hub's GET
+        requests for it.
+        """
+        size = unified_downloader.LARGE_FILE_THRESHOLD
+        fake_hub.repos["fake/large"] = {
+            "config.json": SYNTHETIC_MODEL["config.json"],
+            "model.safetensors": size,
+        }
+
+        assert unified_downloader.download_huggingface(
+            "fake/large", temp_dir, endpoint=fake_hub.url, max_workers=4
+        )
 
-        def on_error(msg):
-            nonlocal got_error, error_msg
-            got_error = True
-            error_msg = msg
-            loop.quit()
+        path = os.path.join(temp_dir, "large", "model.safetensors")
+        assert os.path.getsize(path) == size
+        assert not os.path.exists(path + ".incomplete"), "Temporary file left behind"
+        gets = [
+            byte_range
+            for method, name, byte_range in fake_hub.requests
+            if method == "GET" and name == "model.safetensors"
+        ]
+        return path, gets
 
-        def on_finished():
-            # Should not finish successfully
-            loop.quit()
+    def test_large_file_ranged(self, temp_dir, fake_hub):
+        """Test a large LFS file fetched with parallel ranged requests"""
+        _, gets = self._download_large(temp_dir, fake_hub)
 
-        worker.error.connect(on_error)
-        worker.finished.connect(on_finished)
+        assert len(gets) > 1, "Large file was not split into ranges"
+        assert all(gets), "Large file was also fetched without a range"
 
-        QTimer.singleShot(30000, loop.quit)  # 30 seconds timeout
+    def test_large_file_checksum_mismatch(self, temp_dir, fake_hub):
+        """Test a large file failing verification falls back to a plain GET"""
+        fake_hub.sha256_overrides[("fake/large", "model.safetensors")] = "0" * 64
 
-        worker.start()
-        loop.exec()
+        _, gets = self._download_large(temp_dir, fake_hub)
 
-        assert got_error, "Should have gotten an error for invalid model ID"
-        assert (
-            "not found" in error_msg.lower()
-            or "does not exist" in error_msg.lower()
-            or "404" in error_msg.lower()
-        )
-        print(f"✅ Correctly handled invalid model ID: {error_msg}")
+        assert any(gets), "Ranged download was not attempted"
+        assert None in gets, "No fallback download after the checksum mismatch"
 
 
 if __name__ == "__main__":